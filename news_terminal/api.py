@@ -2,9 +2,28 @@
 NewsAPI Client for fetching news articles.
 """
 
-import requests
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+from news_terminal.cache import HEADLINES_DISK_TTL, HEADLINES_TTL, get_cache
+
+
+@lru_cache(maxsize=2048)
+def _format_published(published: str) -> str:
+    """Format an ISO 8601 timestamp for display, leaving bad values untouched."""
+    try:
+        dt = datetime.fromisoformat(published.replace("Z", "+00:00"))
+        return dt.strftime("%H:%M • %d %b %Y")
+    except ValueError:
+        return published
 
 
 class NewsAPIClient:
@@ -20,19 +39,29 @@ class NewsAPIClient:
         "5": ("health", "Health"),
     }
     
+    CACHE_SIZE = 16
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.session = requests.Session()
+        # Single host; enough connections for the concurrent category prefetch
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=len(self.CATEGORIES)))
         self.session.headers.update({
             "X-Api-Key": api_key,
-            "User-Agent": "NewsTerminal/1.0"
+            "User-Agent": "NewsTerminal/1.0",
+            "Connection": "keep-alive"
         })
+        # (category, country, page_size) -> (fetched_at, etag, response dict)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def get_top_headlines(
         self,
         category: str = "general",
         country: str = "us",
-        page_size: int = 20
+        page_size: int = 20,
+        force: bool = False,
+        timeout: float = 10
     ) -> dict:
         """
         Fetch top headlines.
@@ -41,10 +70,22 @@ class NewsAPIClient:
             category: News category (general, business, technology, sports, health, etc.)
             country: Country code (us, id, gb, etc.)
             page_size: Number of articles to fetch
+            force: Skip the cache and ask the server (still revalidates via ETag)
+            timeout: Seconds to wait on the server
         
         Returns:
             dict with 'status', 'totalResults', and 'articles'
         """
+        key = (category, country, page_size)
+        cached = self._get_cached(key)
+        if not force and cached and time.monotonic() - cached[0] < HEADLINES_TTL:
+            return cached[2]
+        
+        # Revalidate a stale entry instead of downloading it again
+        headers = {}
+        if cached and cached[1]:
+            headers["If-None-Match"] = cached[1]
+        
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/top-headlines",
@@ -53,16 +94,24 @@ class NewsAPIClient:
                     "country": country,
                     "pageSize": page_size
                 },
-                timeout=10
+                headers=headers,
+                timeout=timeout
             )
+            if response.status_code == 304 and cached:
+                self._set_cached(key, cached[1], cached[2])
+                return cached[2]
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            data = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             return {
                 "status": "error",
                 "message": str(e),
                 "articles": []
             }
+        
+        if data.get("status") == "ok":
+            self._set_cached(key, response.headers.get("ETag"), data)
+        return data
     
     def search_news(
         self,
@@ -93,24 +142,51 @@ class NewsAPIClient:
                 timeout=10
             )
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             return {
                 "status": "error",
                 "message": str(e),
                 "articles": []
             }
     
+    def _get_cached(self, key: tuple) -> Optional[tuple]:
+        """Return the cached (fetched_at, etag, data) entry for a request."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry:
+                self._cache.move_to_end(key)
+                return entry
+        
+        # Fall back to a response saved by a previous run
+        disk = get_cache()
+        stored = disk.get(("headlines",) + key) if disk is not None else None
+        if stored is None:
+            return None
+        # Stored with a wall-clock fetch time; monotonic clocks reset on reboot
+        fetched_at, etag, data = stored
+        entry = (time.monotonic() - (time.time() - fetched_at), etag, data)
+        with self._cache_lock:
+            self._cache.setdefault(key, entry)
+        return entry
+    
+    def _set_cached(self, key: tuple, etag: Optional[str], data: dict) -> None:
+        """Store a response, evicting the least recently used entry."""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), etag, data)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        disk = get_cache()
+        if disk is not None:
+            disk.set(("headlines",) + key, (time.time(), etag, data), expire=HEADLINES_DISK_TTL)
+    
     @staticmethod
     def format_article(article: dict) -> dict:
         """Format article data for display."""
         published = article.get("publishedAt", "")
         if published:
-            try:
-                dt = datetime.fromisoformat(published.replace("Z", "+00:00"))
-                published = dt.strftime("%H:%M • %d %b %Y")
-            except ValueError:
-                pass
+            published = _format_published(published)
         
         return {
             "title": article.get("title", "No title"),
@@ -0,0 +1,52 @@
+"""
+Persistent on-disk cache for News Terminal.
+Keeps headlines and scraped article text between runs.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path.home() / ".cache" / "news-terminal"
+
+# Headlines are reused without asking the server for this long, in memory
+# and on disk alike; kept under the Textual app's 5 minute auto-refresh
+HEADLINES_TTL = 2 * 60  # 2 minutes
+# Stale headlines stay on disk this long so a later run can revalidate
+# them with their ETag instead of downloading them again
+HEADLINES_DISK_TTL = 24 * 60 * 60  # 24 hours
+ARTICLE_TTL = 24 * 60 * 60  # 24 hours
+
+_cache = None
+_cache_opened = False
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional["diskcache.Cache"]:
+    """Open the cache directory on first use.
+    
+    Returns None if it can't be opened (e.g. ~/.cache isn't writable);
+    callers then keep to their in-memory caches.
+    """
+    global _cache, _cache_opened
+    if not _cache_opened:
+        # Threads fetching in parallel must not each open a connection
+        with _cache_lock:
+            if not _cache_opened:
+                # Deferred import: diskcache pulls in sqlite3, not needed to start up
+                import sqlite3
+                
+                import diskcache
+                
+                try:
+                    _cache = diskcache.Cache(str(CACHE_DIR))
+                except (OSError, sqlite3.Error):
+                    _cache = None
+                _cache_opened = True
+    return _cache
+
+
+def article_key(url: str) -> str:
+    """Cache key for the scraped text of an article URL."""
+    return "article:" + hashlib.sha1(url.encode("utf-8")).hexdigest()
@@ -3,10 +3,11 @@ Configuration handler for News Terminal.
 Manages API key storage and retrieval.
 """
 
-import json
 import os
 from pathlib import Path
 
+import orjson
+
 CONFIG_FILE = Path(__file__).parent.parent / "config.json"
 
 
@@ -14,11 +15,10 @@ def get_api_key() -> str:
     """Get API key from config file or prompt user to enter one."""
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, "r") as f:
-                config = json.load(f)
-                if config.get("api_key"):
-                    return config["api_key"]
-        except (json.JSONDecodeError, IOError):
+            config = orjson.loads(CONFIG_FILE.read_bytes())
+            if config.get("api_key"):
+                return config["api_key"]
+        except (orjson.JSONDecodeError, OSError):
             pass
     
     # Prompt user for API key
@@ -42,8 +42,7 @@ def get_api_key() -> str:
 def save_api_key(api_key: str) -> None:
     """Save API key to config file."""
     config = {"api_key": api_key}
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    CONFIG_FILE.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
 
 def clear_api_key() -> None:
@@ -7,6 +7,9 @@ Main entry point using Textual.
 import sys
 import os
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 
 # Add parent directory to path for direct execution
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,7 +19,8 @@ from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import Header, Footer, Static, Button, Label, ListView, ListItem
 from textual.binding import Binding
-from textual import on
+from textual import on, work
+from textual.worker import get_current_worker
 from rich.text import Text
 from rich.panel import Panel
 
@@ -29,6 +33,11 @@ from news_terminal.scraper import ArticleScraper
 ORANGE = "#FF9500"
 SOFT_ORANGE = "#FFB347"
 
+# Rule drawn above and below the article body
+SEPARATOR_LINE = Text("─" * 60, style="dim")
+
+format_article = NewsAPIClient.format_article
+
 
 class NewsItem(ListItem):
     """A clickable news article item."""
@@ -39,14 +48,23 @@ class NewsItem(ListItem):
         self.index = index
     
     def compose(self) -> ComposeResult:
-        title = self.article.get("title", "No title")[:75]
-        if len(self.article.get("title", "")) > 75:
-            title += "..."
+        # Markup is stored on the (memoized) article so refreshes reuse it
+        markup = self.article.get("_markup")
+        if markup is None:
+            markup = self.article["_markup"] = self.build_markup(self.article)
+        yield Static(markup)
+    
+    @staticmethod
+    def build_markup(article: dict) -> str:
+        """Build the list entry markup for an article."""
+        title = article.get("title") or "No title"
+        if len(title) > 75:
+            title = title[:75] + "..."
         
-        source = self.article.get("source", "Unknown")
-        time = self.article.get("published", "")
+        source = article.get("source", "Unknown")
+        time = article.get("published", "")
         
-        yield Static(f"[bold]{title}[/]\n[dim italic]{source}[/dim italic] • [dim]{time}[/dim]")
+        return f"[bold]{title}[/]\n[dim italic]{source}[/dim italic] • [dim]{time}[/dim]"
 
 
 class CategoryButton(Button):
@@ -87,7 +105,7 @@ class ArticleDetail(Container):
             content.append(self.source_info.replace("alternative: ", ""), style="cyan")
         
         content.append("\n")
-        content.append("─" * 60, style="dim")
+        content.append_text(SEPARATOR_LINE)
         content.append("\n\n")
         
         # Show full content if available, otherwise description
@@ -101,7 +119,7 @@ class ArticleDetail(Container):
             content.append("[Could not fetch full article - try Open in Browser]", style="dim italic")
         
         content.append("\n\n")
-        content.append("─" * 60, style="dim")
+        content.append_text(SEPARATOR_LINE)
         content.append("\n")
         content.append("🔗 ", style="dim")
         content.append(self.article.get("url", ""), style=f"underline {SOFT_ORANGE}")
@@ -199,6 +217,11 @@ class NewsTerminalApp(App):
         padding: 1;
     }
     
+    .article-loading {
+        padding: 1 2;
+        color: #FF9500;
+    }
+    
     .detail-buttons {
         dock: top;
         height: 3;
@@ -239,6 +262,12 @@ class NewsTerminalApp(App):
         self.showing_detail = False
         self.scraper = ArticleScraper()
         self.auto_refresh_seconds = 300  # 5 minutes (adjustable)
+        self.formatted_cache = {}  # article URL -> formatted article
+        self.prefetched_articles = OrderedDict()  # article URL -> (content, source_info)
+        # Scrapes for article prefetching; one pool for the app's lifetime
+        self.article_pool = ThreadPoolExecutor(max_workers=4)
+        self.article_futures = set()  # Prefetch scrapes not finished yet
+        self.list_urls = []  # URLs of the rows currently in the list
         
         self.categories = {
             "1": ("general", "Headlines"),
@@ -276,40 +305,157 @@ class NewsTerminalApp(App):
             self.api_key = get_api_key()
             self.client = NewsAPIClient(self.api_key)
             self.load_news()
+            self.prefetch_categories()
             # Start auto-refresh timer (efficient, doesn't use extra RAM)
             self.set_interval(self.auto_refresh_seconds, self.auto_refresh)
         except ValueError:
             self.exit(message="API key required")
     
+    def on_unmount(self) -> None:
+        """Drop queued prefetch scrapes so exit only waits on running ones."""
+        for future in list(self.article_futures):
+            future.cancel()
+        self.article_pool.shutdown(wait=False)
+    
     def auto_refresh(self) -> None:
         """Auto-refresh news if not viewing article detail."""
         if not self.showing_detail:
             self.load_news()
     
-    def load_news(self) -> None:
-        """Load news from API."""
-        cat_code = self.categories.get(self.current_category, ("general", "Headlines"))[0]
-        result = self.client.get_top_headlines(category=cat_code)
-        
-        self.articles = [self.client.format_article(a) for a in result.get("articles", [])]
-        
-        # Update list
-        list_view = self.query_one("#articles-list", ListView)
-        list_view.clear()
-        
-        for i, article in enumerate(self.articles[:15]):
-            list_view.append(NewsItem(article, i))
-        
+    def load_news(self, force: bool = False) -> None:
+        """Load news from API in the background."""
         # Hide detail view
         self.query_one("#article-detail").display = False
         self.query_one("#news-list").display = True
         self.showing_detail = False
+        
+        self.fetch_news(self.current_category, force)
+    
+    @work(thread=True, group="prefetch")
+    def prefetch_categories(self) -> None:
+        """Warm the client cache for the other categories concurrently."""
+        others = [code for cat_id, (code, _) in self.categories.items() if cat_id != self.current_category]
+        with ThreadPoolExecutor(max_workers=len(others)) as executor:
+            list(executor.map(self.client.get_top_headlines, others))
+    
+    @work(exclusive=True, thread=True, group="news")
+    def fetch_news(self, category_id: str, force: bool = False) -> None:
+        """Fetch headlines off the UI thread."""
+        cat_code = self.categories.get(category_id, ("general", "Headlines"))[0]
+        result = self.client.get_top_headlines(category=cat_code, force=force)
+        articles = list(map(self.format_cached, result.get("articles", ())))
+        
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self.update_news_list, articles)
+    
+    def format_cached(self, article: dict) -> dict:
+        """Format an article, reusing the result for URLs seen before."""
+        url = article.get("url")
+        if not url:
+            return format_article(article)
+        
+        formatted = self.formatted_cache.get(url)
+        if formatted is None:
+            if len(self.formatted_cache) >= 256:
+                self.formatted_cache.clear()
+            formatted = self.formatted_cache[url] = format_article(article)
+        return formatted
+    
+    async def update_news_list(self, articles: list) -> None:
+        """Replace the article list with freshly fetched articles."""
+        self.articles = articles
+        
+        urls = [a.get("url") for a in self.articles[:15]]
+        if urls != self.list_urls:
+            list_view = self.query_one("#articles-list", ListView)
+            index = list_view.index
+            
+            # Keep the leading rows that are unchanged, rebuild the rest
+            keep = 0
+            while keep < min(len(urls), len(self.list_urls)) and urls[keep] == self.list_urls[keep]:
+                keep += 1
+            
+            if keep:
+                for item in list(list_view.children)[keep:]:
+                    await item.remove()
+            else:
+                await list_view.clear()
+            
+            await list_view.extend(
+                NewsItem(article, i) for i, article in enumerate(self.articles[keep:15], start=keep)
+            )
+            self.list_urls = urls
+            
+            # Re-highlight the cursor row if it was one of the rebuilt rows
+            if keep and index is not None and index >= keep:
+                list_view.index = None
+                list_view.index = index
+        
+        self.prefetch_articles([a["url"] for a in self.articles[:5] if a.get("url")])
     
-    def show_article(self, article: dict) -> None:
-        """Show article detail view with scraped content."""
+    @work(exclusive=True, thread=True, group="prefetch-articles")
+    def prefetch_articles(self, urls: list) -> None:
+        """Scrape the top articles in the background so opening them is instant."""
+        urls = [u for u in urls if u not in self.prefetched_articles]
+        if not urls:
+            return
+        
+        worker = get_current_worker()
+        # Original URL only; the slower alternative-source search runs on demand
+        futures = []
+        for url in urls:
+            future = self.article_pool.submit(self.scraper.fetch_article, url)
+            # Scrapes that do run keep their result even if we're superseded
+            future.add_done_callback(partial(self.store_prefetched, url))
+            futures.append(future)
+        self.article_futures.update(futures)
+        
+        pending = set(futures)
+        try:
+            while pending and not worker.is_cancelled:
+                # Wake up regularly so a newer prefetch (or exit) can stop us
+                _, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+        finally:
+            # Scrapes that haven't started yet are no longer wanted
+            for future in futures:
+                future.cancel()
+            self.article_futures.difference_update(futures)
+    
+    def store_prefetched(self, url: str, future: Future) -> None:
+        """Keep a successful prefetch scrape (runs in the pool thread)."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        if result[0]:
+            self.prefetched_articles[url] = result
+            if len(self.prefetched_articles) > 20:
+                self.prefetched_articles.popitem(last=False)
+    
+    async def show_article(self, article: dict) -> None:
+        """Show article detail view, scraping full content in the background."""
         self.current_article = article
         
-        # Fetch full article content (with fallback search if needed)
+        detail_container = self.query_one("#article-detail")
+        self.query_one("#news-list").display = False
+        detail_container.display = True
+        self.showing_detail = True
+        
+        # The old view must be gone before mounting, or its ids would clash
+        await detail_container.remove_children()
+        # User may have gone back or opened another article meanwhile
+        if not self.showing_detail or article is not self.current_article:
+            return
+        
+        prefetched = self.prefetched_articles.get(article.get("url"))
+        if prefetched:
+            await detail_container.mount(ArticleDetail(article, *prefetched))
+        else:
+            await detail_container.mount(Static("Loading article... (Esc to go back)", classes="article-loading"))
+            self.fetch_article(article)
+    
+    @work(exclusive=True, thread=True, group="article")
+    def fetch_article(self, article: dict) -> None:
+        """Fetch full article content (with fallback search if needed) off the UI thread."""
         full_content = None
         source_info = "failed"
         url = article.get("url")
@@ -318,19 +464,26 @@ class NewsTerminalApp(App):
         if url:
             full_content, source_info = self.scraper.fetch_article(url, title)
         
-        detail_container = self.query_one("#article-detail")
-        detail_container.remove_children()
-        detail_container.mount(ArticleDetail(article, full_content, source_info))
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self.mount_article_detail, article, full_content, source_info)
+    
+    async def mount_article_detail(self, article: dict, full_content: str, source_info: str) -> None:
+        """Replace the loading placeholder with the article detail view."""
+        # User may have gone back or opened another article meanwhile
+        if not self.showing_detail or article is not self.current_article:
+            return
         
-        self.query_one("#news-list").display = False
-        detail_container.display = True
-        self.showing_detail = True
+        detail_container = self.query_one("#article-detail")
+        await detail_container.remove_children()
+        if not self.showing_detail or article is not self.current_article:
+            return
+        await detail_container.mount(ArticleDetail(article, full_content, source_info))
     
     @on(ListView.Selected, "#articles-list")
-    def on_article_selected(self, event: ListView.Selected) -> None:
+    async def on_article_selected(self, event: ListView.Selected) -> None:
         """Handle article selection."""
         if isinstance(event.item, NewsItem):
-            self.show_article(event.item.article)
+            await self.show_article(event.item.article)
     
     @on(Button.Pressed, "#back")
     def on_back_pressed(self) -> None:
@@ -382,7 +535,7 @@ class NewsTerminalApp(App):
     
     def action_refresh(self) -> None:
         """Refresh news."""
-        self.load_news()
+        self.load_news(force=True)
     
     def action_category_1(self) -> None:
         self.switch_category("1")
@@ -3,10 +3,65 @@ Article scraper with fallback search to fetch full content from multiple sources
 """
 
 import requests
+import soupsieve
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from html import unescape
 from bs4 import BeautifulSoup
 from typing import Optional, List, Tuple
 import re
-import urllib.parse
+import threading
+from urllib.parse import quote, unquote, urlparse
+
+from news_terminal.cache import ARTICLE_TTL, article_key, get_cache
+
+# lxml is optional at runtime: some Termux builds lack libxml2, in which
+# case scraping falls back to BeautifulSoup's html.parser
+try:
+    import lxml.html
+    from lxml import etree
+    from lxml.cssselect import CSSSelector
+    from cssselect import HTMLTranslator
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+_PUNCT = re.compile(r'[^\w\s]')
+_UDDG = re.compile(r'uddg=([^&]+)')
+_MULTINL = re.compile(r'\n{3,}')
+_DDG_LINK = re.compile(r'class="result__a"[^>]*href="([^"]+)"')
+
+# Block elements whose text makes up the article body
+TEXT_TAGS = frozenset(('p', 'h2', 'h3', 'blockquote'))
+
+
+@lru_cache(maxsize=256)
+def _domain(url: str) -> str:
+    """Extract domain from URL (alternative sources often share domains)."""
+    try:
+        return urlparse(url).netloc.replace('www.', '')
+    except Exception:
+        return "unknown"
+
+
+def _blocked(excluded: List[str]) -> str:
+    """XPath union matching a node that is, or sits inside, an excluded element."""
+    translator = HTMLTranslator()
+    return ' | '.join(translator.css_to_xpath(sel, prefix='ancestor-or-self::') for sel in excluded)
+
+
+def _xpaths_outside(selectors: List[str], excluded: List[str], prefix: str = 'descendant-or-self::') -> list:
+    """
+    Compile CSS selectors to XPath that skips matches inside any excluded
+    element, so unwanted nodes never have to be removed from the tree.
+    """
+    translator = HTMLTranslator()
+    blocked = _blocked(excluded)
+    return [
+        etree.XPath(f'({translator.css_to_xpath(sel, prefix=prefix)})[not({blocked})]')
+        for sel in selectors
+    ]
 
 
 class ArticleScraper:
@@ -37,19 +92,56 @@ class ArticleScraper:
         '[class*="popup"]', '[class*="modal"]',
     ]
     
+    # URL fragments of non-article pages, matched in a single pass
+    SKIP_PATTERNS = [
+        'youtube.com', 'twitter.com', 'facebook.com', 'instagram.com',
+        'reddit.com', 'wikipedia.org', 'amazon.com', 'ebay.com',
+        '/search', '/category', '/tag/', '/author/'
+    ]
+    SKIP_RE = re.compile('|'.join(map(re.escape, SKIP_PATTERNS)), re.IGNORECASE)
+    
+    # Selectors compiled once: removal is a single combined pass, content
+    # candidates are gathered in one pass and ranked by selector priority
+    REMOVE_CSS = soupsieve.compile(', '.join(REMOVE_SELECTORS))
+    CONTENT_CSS = soupsieve.compile(', '.join(CONTENT_SELECTORS))
+    CONTENT_PATTERNS = [soupsieve.compile(selector) for selector in CONTENT_SELECTORS]
+    
+    # Same selectors as XPath for the lxml parser, with removal folded in
+    if HAS_LXML:
+        REMOVE_XPATH = CSSSelector(', '.join(REMOVE_SELECTORS))
+        CONTENT_XPATHS = _xpaths_outside(CONTENT_SELECTORS, REMOVE_SELECTORS)
+        TEXT_XPATH = _xpaths_outside([', '.join(sorted(TEXT_TAGS))], REMOVE_SELECTORS, 'descendant::')[0]
+        STORY_XPATH = _xpaths_outside(['article'], REMOVE_SELECTORS, 'self::')[0]
+        VISIBLE_TEXT_XPATH = etree.XPath(f'descendant::text()[not({_blocked(REMOVE_SELECTORS)})]')
+    
+    # Stop downloading once an <article> with at least this much text has closed
+    EARLY_EXIT_CHARS = 500
+    CHUNK_SIZE = 16384
+    
+    # Alternative sources race each other, so a slow one isn't worth waiting
+    # on (a hung one still costs up to twice this: the adapter retries once)
+    ALT_TIMEOUT = 3
+    
     def __init__(self):
         self.session = requests.Session()
+        # Larger pool so prefetching and alternative sources keep connections warm
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=1)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         # Use mobile user-agent for better compatibility
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Linux; Android 13; Pixel 7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
+            'Connection': 'keep-alive',
         })
         # Disable SSL verification for Termux compatibility
         self.session.verify = False
         # Suppress SSL warnings
         import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        # Shared by every alternative-source race (threads start on demand)
+        self._executor = ThreadPoolExecutor(max_workers=5)
     
     def fetch_article(self, url: str, title: str = None) -> Tuple[Optional[str], str]:
         """
@@ -62,6 +154,21 @@ class ArticleScraper:
         Returns:
             Tuple of (content, source_info) where source_info indicates the source
         """
+        # Without a usable cache directory articles are just fetched each time
+        disk = get_cache() if url else None
+        key = article_key(url) if disk is not None else None
+        if key:
+            cached = disk.get(key)
+            if cached is not None:
+                return cached
+        
+        content, source_info = self._fetch_article(url, title)
+        if key and content:
+            disk.set(key, (content, source_info), expire=ARTICLE_TTL)
+        return content, source_info
+    
+    def _fetch_article(self, url: str, title: str = None) -> Tuple[Optional[str], str]:
+        """Scrape an article, searching for alternative sources if it fails."""
         # Try primary URL first
         content = self._scrape_url(url)
         if content:
@@ -69,47 +176,67 @@ class ArticleScraper:
         
         # If failed and we have a title, search for alternative sources
         if title:
-            alt_urls = self._search_alternative_sources(title)
-            for alt_url in alt_urls:
-                if alt_url != url:  # Don't retry the same URL
-                    content = self._scrape_url(alt_url)
-                    if content:
-                        return content, f"alternative: {self._get_domain(alt_url)}"
+            alt_urls = [u for u in self._search_alternative_sources(title) if u != url]
+            if alt_urls:
+                return self._scrape_first(alt_urls)
         
         return None, "failed"
     
-    def _scrape_url(self, url: str) -> Optional[str]:
-        """Try to scrape content from a single URL."""
+    def _scrape_first(self, urls: List[str]) -> Tuple[Optional[str], str]:
+        """Scrape URLs concurrently and return the first one with content."""
+        responses = []  # Streams opened by the workers, closed once we're done
+        done = threading.Event()  # Tells workers still connecting to give up
+        futures = {
+            self._executor.submit(self._scrape_url, u, responses, done, self.ALT_TIMEOUT): u
+            for u in urls
+        }
+        try:
+            for future in as_completed(futures):
+                content = future.result()
+                if content:
+                    return content, f"alternative: {self._get_domain(futures[future])}"
+            return None, "failed"
+        finally:
+            # Stop the slower requests once we have a result: drop the ones
+            # not started yet, close the streams of those mid-download, and
+            # have those still connecting bail out once headers arrive
+            done.set()
+            for future in futures:
+                future.cancel()
+            for response in list(responses):
+                response.close()
+    
+    def _scrape_url(self, url: str, responses: list = None, stop: threading.Event = None,
+                    timeout: float = 15) -> Optional[str]:
+        """
+        Try to scrape content from a single URL.
+        
+        The open response is added to responses, if given, so another
+        thread can close it to abort the download; once stop is set the
+        scrape is abandoned as soon as the response headers arrive.
+        """
         if not url:
             return None
         
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            # Try lxml first, fall back to html.parser
-            try:
-                soup = BeautifulSoup(response.text, 'lxml')
-            except Exception:
-                soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove unwanted elements
-            for selector in self.REMOVE_SELECTORS:
-                for element in soup.select(selector):
-                    element.decompose()
-            
-            # Try to find main content
-            content = None
-            for selector in self.CONTENT_SELECTORS:
-                elements = soup.select(selector)
-                if elements:
-                    content = max(elements, key=lambda x: len(x.get_text()))
-                    break
-            
-            if not content:
-                content = soup.body if soup.body else soup
-            
-            text = self._extract_text(content)
+            with self.session.get(url, timeout=timeout, stream=True) as response:
+                if responses is not None:
+                    responses.append(response)
+                if stop is not None and stop.is_set():
+                    return None
+                response.raise_for_status()
+                if HAS_LXML:
+                    received = []
+                    try:
+                        text = self._parse_lxml(response, received)
+                    except etree.LxmlError:
+                        # lxml gave up (e.g. empty or mangled body): re-parse
+                        # what was read, plus the rest, with BeautifulSoup
+                        received.extend(response.iter_content(self.CHUNK_SIZE))
+                        html = b''.join(received).decode(response.encoding or 'utf-8', errors='replace')
+                        text = self._parse_soup(html)
+                else:
+                    text = self._parse_soup(response.text)
             
             if len(text) < 100:
                 return None
@@ -119,6 +246,77 @@ class ArticleScraper:
         except Exception:
             return None
     
+    def _parse_lxml(self, response: requests.Response, received: list) -> str:
+        """
+        Extract article text with lxml, parsing the body as it streams in.
+        
+        Chunks read from the response are appended to received, so the
+        caller can re-parse them if lxml raises.
+        """
+        parser = etree.HTMLPullParser(events=('end',), tag='article', encoding=response.encoding)
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        
+        for chunk in response.iter_content(self.CHUNK_SIZE):
+            received.append(chunk)
+            parser.feed(chunk)
+            # A complete, substantial <article> is the story; skip the rest of the page
+            if any(self._is_story(el) for _, el in parser.read_events()):
+                break
+        
+        root = parser.close()
+        
+        # Try to find main content
+        content = None
+        for selector in self.CONTENT_XPATHS:
+            elements = selector(root)
+            if elements:
+                content = max(elements, key=self._text_length)
+                break
+        
+        if content is None:
+            content = root.find('body')
+            if content is None:
+                content = root
+        
+        return self._extract_lxml_text(content)
+    
+    def _text_length(self, element) -> int:
+        """Length of an element's text, leaving out scripts, asides etc."""
+        return sum(map(len, self.VISIBLE_TEXT_XPATH(element)))
+    
+    def _is_story(self, element) -> bool:
+        """Whether a just-closed <article> is the main story, not page filler."""
+        return (
+            self._text_length(element) >= self.EARLY_EXIT_CHARS
+            # Cards inside aside/nav/related blocks don't count...
+            and bool(self.STORY_XPATH(element))
+            # ...nor articles nested in one that's still open (live blogs)
+            and next(element.iterancestors('article'), None) is None
+        )
+    
+    def _parse_soup(self, html: str) -> str:
+        """Extract article text using BeautifulSoup (fallback parser)."""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Remove unwanted elements (nested matches may already be gone)
+        for element in self.REMOVE_CSS.select(soup):
+            if not element.decomposed:
+                element.decompose()
+        
+        # Try to find main content
+        content = None
+        candidates = self.CONTENT_CSS.select(soup)
+        for pattern in self.CONTENT_PATTERNS:
+            elements = [el for el in candidates if pattern.match(el)]
+            if elements:
+                content = max(elements, key=lambda x: len(x.get_text()))
+                break
+        
+        if not content:
+            content = soup.body if soup.body else soup
+        
+        return self._extract_text(content)
+    
     def _search_alternative_sources(self, title: str) -> List[str]:
         """
         Search for alternative sources using DuckDuckGo HTML.
@@ -126,8 +324,8 @@ class ArticleScraper:
         """
         try:
             # Clean title for search
-            search_query = re.sub(r'[^\w\s]', '', title)[:100]
-            encoded_query = urllib.parse.quote(f"{search_query} news")
+            search_query = _PUNCT.sub('', title)[:100]
+            encoded_query = quote(f"{search_query} news")
             
             # Use DuckDuckGo HTML version (no API key needed)
             search_url = f"https://html.duckduckgo.com/html/?q={encoded_query}"
@@ -135,17 +333,15 @@ class ArticleScraper:
             response = self.session.get(search_url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Extract result URLs
+            # Extract result URLs straight from the markup, no DOM needed
             urls = []
-            for link in soup.select('a.result__a'):
-                href = link.get('href', '')
+            for link in _DDG_LINK.finditer(response.text):
+                href = unescape(link.group(1))
                 # DuckDuckGo wraps URLs, extract the actual URL
                 if 'uddg=' in href:
-                    match = re.search(r'uddg=([^&]+)', href)
+                    match = _UDDG.search(href)
                     if match:
-                        actual_url = urllib.parse.unquote(match.group(1))
+                        actual_url = unquote(match.group(1))
                         if self._is_news_url(actual_url):
                             urls.append(actual_url)
                 elif href.startswith('http'):
@@ -162,34 +358,44 @@ class ArticleScraper:
     
     def _is_news_url(self, url: str) -> bool:
         """Check if URL is likely a news article."""
-        # Skip non-article pages
-        skip_patterns = [
-            'youtube.com', 'twitter.com', 'facebook.com', 'instagram.com',
-            'reddit.com', 'wikipedia.org', 'amazon.com', 'ebay.com',
-            '/search', '/category', '/tag/', '/author/'
-        ]
-        return not any(pattern in url.lower() for pattern in skip_patterns)
+        return not self.SKIP_RE.search(url)
     
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        try:
-            from urllib.parse import urlparse
-            return urlparse(url).netloc.replace('www.', '')
-        except Exception:
-            return "unknown"
+        return _domain(url)
     
     def _extract_text(self, element) -> str:
         """Extract clean text from HTML element."""
-        paragraphs = element.find_all(['p', 'h2', 'h3', 'blockquote'])
+        found = False
+        texts = []
+        for node in element.descendants:
+            if getattr(node, 'name', None) in TEXT_TAGS:
+                found = True
+                text = node.get_text(strip=True)
+                if len(text) > 20:
+                    texts.append(text)
+        
+        if found:
+            return '\n\n'.join(texts)
+        else:
+            text = element.get_text(separator='\n', strip=True)
+            text = _MULTINL.sub('\n\n', text)
+            return text
+    
+    def _extract_lxml_text(self, element) -> str:
+        """Extract clean text from an lxml element."""
+        paragraphs = self.TEXT_XPATH(element)
         
         if paragraphs:
             texts = []
             for p in paragraphs:
-                text = p.get_text(strip=True)
+                text = p.text_content().strip()
                 if text and len(text) > 20:
                     texts.append(text)
             return '\n\n'.join(texts)
         else:
-            text = element.get_text(separator='\n', strip=True)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            return text
+            # Rare path: strip unwanted elements before taking all text
+            for removed in self.REMOVE_XPATH(element):
+                removed.drop_tree()
+            lines = (t.strip() for t in element.itertext())
+            return '\n'.join(line for line in lines if line)
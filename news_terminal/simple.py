@@ -6,48 +6,98 @@ Uses Rich instead of Textual for wider terminal support.
 
 import sys
 import os
+import select
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows: no termios, fall back to line input
+    termios = None
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
+from rich.style import Style
 from rich import box
+from contextlib import contextmanager
 from datetime import datetime
-import time
+from functools import lru_cache
+from itertools import islice
 
 from news_terminal.config import get_api_key
 from news_terminal.api import NewsAPIClient
-from news_terminal.scraper import ArticleScraper
+from news_terminal.cache import HEADLINES_TTL
 
 # Colors
 ORANGE = "#FF9500"
 SOFT_ORANGE = "#FFB347"
 
+# Prebuilt styles, so renders neither rebuild nor re-parse style strings
+STYLE_BOLD_ORANGE = Style(color=ORANGE, bold=True)
+STYLE_URL = Style(color=SOFT_ORANGE, underline=True)
+
+# Seconds to wait for a key before checking whether the clock moved on
+KEY_TIMEOUT = 1.0
+# Background category fetches give up sooner, so quitting never waits long
+PREFETCH_TIMEOUT = 4
+# How long the rest of an escape sequence may lag behind ESC (cf. curses'
+# ESCDELAY); over ssh the bytes can arrive in separate reads
+ESC_DELAY = 0.04
+
+MAIN_PROMPT = "Press 1-9 (0 = 10) to read article, or H/B/T/S/E/R/Q"
+FETCH_PROMPT = "[F] Fetch full article  [Enter] Back"
+BACK_PROMPT = "Press Enter to go back..."
+
+# Rule drawn above and below the article body
+SEPARATOR_LINE = Text("─" * 50, style="dim")
+
+# Full article text is cut to this many characters in the detail view
+MAX_CONTENT_CHARS = 2000
+TRUNC_SUFFIX = "\n\n[...truncated, open in browser for full article]"
+
 console = Console()
+format_article = NewsAPIClient.format_article
+
+# Live display while browsing with single-key input (None in line mode)
+_live = None
+# Body of the last frame shown, redrawn under a fresh header on clock ticks
+_frame = ()
+# Last articles panel as (articles, selected, panel); lists are replaced,
+# never edited in place, so identity tells whether it is still current
+_articles_panel = (None, None, None)
 
 
 def clear_screen():
     """Clear terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    console.clear()
+
 
+def render_header() -> Panel:
+    """Build header panel (reused until the clock minute changes)."""
+    return _header_panel(int(time.time()) // 60)
 
-def show_header():
-    """Display header."""
-    now = datetime.now().strftime("%H:%M • %d %b %Y")
+
+@lru_cache(maxsize=1)
+def _header_panel(minute: int) -> Panel:
+    """Build header panel for the given epoch minute."""
+    now = datetime.fromtimestamp(minute * 60).strftime("%H:%M • %d %b %Y")
     header = Text()
-    header.append("██ ", style=f"bold {ORANGE}")
-    header.append("NEWS TERMINAL", style=f"bold {ORANGE}")
+    header.append("██ ", style=STYLE_BOLD_ORANGE)
+    header.append("NEWS TERMINAL", style=STYLE_BOLD_ORANGE)
     header.append(f"  │  {now}", style=SOFT_ORANGE)
-    console.print(Panel(header, box=box.HEAVY, border_style=ORANGE))
+    return Panel(header, box=box.HEAVY, border_style=ORANGE)
 
 
-def show_menu():
-    """Display category menu."""
+def render_menu() -> Text:
+    """Build category menu."""
     menu = Text()
-    menu.append("[H] Headlines  ", style=f"bold {ORANGE}")
+    menu.append("[H] Headlines  ", style=STYLE_BOLD_ORANGE)
     menu.append("[B] Business  ", style=SOFT_ORANGE)
     menu.append("[T] Tech  ", style=SOFT_ORANGE)
     menu.append("[S] Sports  ", style=SOFT_ORANGE)
@@ -55,42 +105,85 @@ def show_menu():
     menu.append("  │  ", style="dim")
     menu.append("[R] Refresh  ", style="dim")
     menu.append("[Q] Quit", style="dim")
-    console.print(menu)
-    console.print()
+    return menu
+
 
+def prepare_article(raw: dict) -> dict:
+    """Format an API article and precompute its list-row cells."""
+    article = format_article(raw)
+    title = article.get("title") or "No title"
+    article["_display_title"] = (title[:60] + "...") if len(title) > 60 else title
+    article["_source_text"] = Text(article.get("source", ""), style="dim italic")
+    return article
 
-def show_articles(articles: list, selected: int = 0):
-    """Display article list."""
+
+# The menu never changes, so build it once
+MENU = render_menu()
+
+
+def render_articles(articles: list, selected: int = 0) -> Panel:
+    """Build article list panel, reusing the last one if nothing changed."""
+    global _articles_panel
+    cached_articles, cached_selected, panel = _articles_panel
+    if articles is cached_articles and selected == cached_selected:
+        return panel
+    
     table = Table(show_header=False, box=None, padding=(0, 1), expand=True)
     table.add_column("num", width=3)
     table.add_column("title", ratio=3)
     table.add_column("source", ratio=1, justify="right")
     
-    for i, article in enumerate(articles[:10]):
-        num_style = f"bold {ORANGE}" if i == selected else "dim"
-        title_style = f"bold white" if i == selected else "white"
-        
-        title = article.get("title", "No title")[:60]
-        if len(article.get("title", "")) > 60:
-            title += "..."
+    for i, article in enumerate(islice(articles, 10)):
+        num_style = STYLE_BOLD_ORANGE if i == selected else "dim"
+        title_style = "bold white" if i == selected else "white"
         
         table.add_row(
-            f"[{num_style}]{i+1}.[/]",
-            f"[{title_style}]{title}[/]",
-            f"[dim italic]{article.get('source', '')}[/]"
+            Text(f"{i+1}.", style=num_style),
+            Text(article["_display_title"], style=title_style),
+            article["_source_text"]
         )
     
-    console.print(Panel(table, title=f"[bold {ORANGE}]TOP HEADLINES[/]", 
-                       border_style=ORANGE, box=box.ROUNDED))
+    panel = Panel(table, title=Text("TOP HEADLINES", style=STYLE_BOLD_ORANGE), 
+                  border_style=ORANGE, box=box.ROUNDED)
+    _articles_panel = (articles, selected, panel)
+    return panel
 
 
-def show_article_detail(article: dict, content: str = None, source_info: str = None):
-    """Display article detail."""
-    clear_screen()
-    show_header()
+def show(*renderables, scroll: bool = False):
+    """Draw one frame: the header followed by the given renderables.
     
+    Frames that may outgrow the terminal (article text) pass scroll=True
+    and are printed on the normal screen, which keeps scrollback; Live's
+    alternate screen would crop them to the terminal height.
+    """
+    global _frame
+    # Scrolled frames aren't redrawn on clock ticks: that would reset the
+    # user's scroll position
+    _frame = () if scroll else renderables
+    frame = Group(render_header(), *renderables)
+    if _live is not None and not scroll:
+        _live.start()  # No-op unless a scrollable frame stopped it
+        _live.update(frame, refresh=True)
+    else:
+        if _live is not None:
+            _live.stop()
+        # Buffer the clear and the frame so they reach stdout in one write
+        with console:
+            clear_screen()
+            console.print(frame)
+
+
+def show_main(articles: list, selected: int = 0, status: str = None):
+    """Display the main screen."""
+    show(MENU, Text(), render_articles(articles, selected), Text(),
+         Text(status or MAIN_PROMPT, style="dim"))
+
+
+def show_article_detail(article: dict, content: str = None, source_info: str = None,
+                        footer: str = None):
+    """Display article detail."""
     text = Text()
-    text.append(article.get("title", "No title"), style=f"bold {ORANGE}")
+    text.append(article.get("title", "No title"), style=STYLE_BOLD_ORANGE)
     text.append("\n\n")
     text.append("Source: ", style="bold dim")
     text.append(article.get("source", "Unknown"), style=SOFT_ORANGE)
@@ -103,31 +196,94 @@ def show_article_detail(article: dict, content: str = None, source_info: str = N
         text.append(source_info.replace("alternative: ", ""), style="cyan")
     
     text.append("\n")
-    text.append("─" * 50, style="dim")
+    text.append_text(SEPARATOR_LINE)
     text.append("\n\n")
     
     if content:
         # Show full content
-        if len(content) > 2000:
-            content = content[:2000] + "\n\n[...truncated]"
-        text.append(content)
+        if len(content) > MAX_CONTENT_CHARS:
+            text.append(content[:MAX_CONTENT_CHARS])
+            text.append(TRUNC_SUFFIX)
+        else:
+            text.append(content)
     else:
         # Show description/summary only
         text.append(article.get("description", "No description."))
     
     text.append("\n\n")
-    text.append("─" * 50, style="dim")
+    text.append_text(SEPARATOR_LINE)
     text.append("\n🔗 ", style="dim")
-    text.append(article.get("url", ""), style=f"underline {SOFT_ORANGE}")
+    text.append(article.get("url", ""), style=STYLE_URL)
+    
+    if footer is None:
+        footer = FETCH_PROMPT if content is None else BACK_PROMPT
     
-    console.print(Panel(text, title=f"[bold {ORANGE}]📰 ARTICLE[/]", 
-                       border_style=ORANGE, box=box.ROUNDED))
+    show(
+        Panel(text, title=Text("📰 ARTICLE", style=STYLE_BOLD_ORANGE), border_style=ORANGE, box=box.ROUNDED),
+        Text(),
+        Text(footer, style="dim"),
+        scroll=True,
+    )
     
     return content is None  # Return True if we need to offer full fetch option
 
 
+def keys_available() -> bool:
+    """Whether single keypresses can be read (POSIX terminal on stdin)."""
+    return termios is not None and sys.stdin.isatty()
+
+
+@contextmanager
+def cbreak():
+    """Read stdin a key at a time, restoring terminal settings on exit."""
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+def read_key(timeout: float = KEY_TIMEOUT):
+    """Read one keypress, or return None if none arrived within timeout.
+    
+    In line mode (no Live display) this blocks on input() instead.
+    """
+    if _live is None:
+        return input().strip().lower()
+    
+    fd = sys.stdin.fileno()
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if not ready:
+        return None
+    # Bypass sys.stdin's buffer so select() sees every pending byte
+    key = os.read(fd, 1)
+    if key == b"\x1b":
+        # Arrows, PgUp etc. send an escape sequence: read it as one key
+        while select.select([fd], [], [], ESC_DELAY)[0]:
+            key += os.read(fd, 32)
+    return key.decode(errors="ignore").lower()
+
+
+def wait_key() -> str:
+    """Wait for a key, redrawing the last frame whenever the clock ticks over."""
+    header = render_header()
+    while True:
+        key = read_key()
+        if key is not None:
+            if len(key) > 1 and key[0] == "\x1b":
+                continue  # Navigation keys aren't bound to anything
+            return key
+        if _frame and render_header() is not header:
+            header = render_header()
+            show(*_frame)
+
+
 def main():
     """Main entry point."""
+    global _live
+    
     console.print("\n[bold]Loading News Terminal...[/]\n")
     
     try:
@@ -137,8 +293,34 @@ def main():
         sys.exit(1)
     
     client = NewsAPIClient(api_key)
-    scraper = ArticleScraper()
     
+    # Load initial news
+    console.print("[dim]Fetching news...[/]")
+    result = client.get_top_headlines(category="general")
+    articles = list(map(prepare_article, result.get("articles", ())))
+    
+    # With single-key input the list is redrawn in place on the alternate
+    # screen; line mode stays on the normal screen, where long articles
+    # can be scrolled back
+    try:
+        if keys_available():
+            from rich.live import Live
+            
+            with cbreak(), Live(console=console, screen=True, auto_refresh=False) as live:
+                _live = live
+                browse(client, articles)
+        else:
+            browse(client, articles)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        _live = None
+    
+    console.print(f"\n[bold {ORANGE}]Thanks for using News Terminal![/]\n")
+
+
+def browse(client: NewsAPIClient, articles: list):
+    """Interactive loop: list, categories and article detail."""
     categories = {
         "h": "general",
         "b": "business",
@@ -155,66 +337,85 @@ def main():
         "e": "Health",
     }
     
+    order = list(categories)
     current_category = "h"
-    articles = []
+    scraper = None  # Created when the first full article is fetched
     
-    # Load initial news
-    console.print("[dim]Fetching news...[/]")
-    result = client.get_top_headlines(category=categories[current_category])
-    articles = [client.format_article(a) for a in result.get("articles", [])]
+    def load(key: str, force: bool = False, timeout: float = 10) -> list:
+        result = client.get_top_headlines(category=categories[key], force=force, timeout=timeout)
+        return list(map(prepare_article, result.get("articles", ())))
     
-    while True:
-        clear_screen()
-        show_header()
-        show_menu()
-        show_articles(articles)
-        
-        console.print("\n[dim]Enter 1-10 to read article, or H/B/T/S/E/R/Q:[/] ", end="")
-        
-        try:
-            choice = input().strip().lower()
-        except (EOFError, KeyboardInterrupt):
-            break
-        
-        if choice == 'q':
-            clear_screen()
-            console.print(f"\n[bold {ORANGE}]Thanks for using News Terminal![/]\n")
-            break
-        
-        elif choice == 'r':
-            console.print("[dim]Refreshing...[/]")
-            result = client.get_top_headlines(category=categories[current_category])
-            articles = [client.format_article(a) for a in result.get("articles", [])]
-        
-        elif choice in categories:
-            current_category = choice
-            console.print(f"[dim]Loading {category_names[choice]}...[/]")
-            result = client.get_top_headlines(category=categories[current_category])
-            articles = [client.format_article(a) for a in result.get("articles", [])]
+    # The next two categories in menu order are fetched in the background
+    # while the user reads, so switching to them doesn't block on HTTP
+    executor = ThreadPoolExecutor(max_workers=2)
+    prefetched = {}  # category key -> (submitted at, Future)
+    
+    def prefetch_next():
+        pos = order.index(current_category)
+        for key in (order[(pos + 1) % len(order)], order[(pos + 2) % len(order)]):
+            if key not in prefetched:
+                prefetched[key] = (time.monotonic(), executor.submit(load, key, timeout=PREFETCH_TIMEOUT))
+    
+    try:
+        prefetch_next()
         
-        elif choice.isdigit() and 1 <= int(choice) <= min(10, len(articles)):
-            idx = int(choice) - 1
-            article = articles[idx]
+        while True:
+            show_main(articles)
+            choice = wait_key()
+            
+            if choice == 'q':
+                break
             
-            # Show summary first (fast!)
-            needs_fetch = show_article_detail(article)
+            elif choice == 'r':
+                show_main(articles, status="Refreshing...")
+                articles = load(current_category, force=True)
             
-            if needs_fetch:
-                console.print("\n[dim][F] Fetch full article  [Enter] Back[/] ", end="")
-                sub_choice = input().strip().lower()
+            elif choice in categories:
+                current_category = choice
+                show_main(articles, status=f"Loading {category_names[choice]}...")
+                
+                # Use the prefetch (waiting on it if still in flight) unless
+                # it's older than the headlines cache would allow
+                submitted, future = prefetched.pop(choice, (None, None))
+                if future is not None and time.monotonic() - submitted < HEADLINES_TTL:
+                    # A prefetch that timed out comes back empty: fetch again
+                    articles = future.result() or load(choice)
+                else:
+                    articles = load(choice)
+                prefetch_next()
+            
+            elif choice.isdigit() and 1 <= (int(choice) or 10) <= min(10, len(articles)):
+                # "0" stands for article 10 when reading single keys
+                idx = (int(choice) or 10) - 1
+                article = articles[idx]
+                
+                # Show summary first (fast!)
+                needs_fetch = show_article_detail(article)
                 
-                if sub_choice == 'f':
-                    console.print("[dim]Fetching full article...[/]")
-                    content, source_info = scraper.fetch_article(
-                        article.get("url"), 
-                        article.get("title")
-                    )
-                    show_article_detail(article, content, source_info)
-                    console.print("\n[dim]Press Enter to go back...[/]")
-                    input()
-            else:
-                console.print("\n[dim]Press Enter to go back...[/]")
-                input()
+                if needs_fetch:
+                    sub_choice = wait_key()
+                    
+                    if sub_choice == 'f':
+                        if scraper is None:
+                            # Deferred import: the scraper pulls in bs4/lxml
+                            from news_terminal.scraper import ArticleScraper
+                            scraper = ArticleScraper()
+                        
+                        show_article_detail(article, footer="Fetching full article...")
+                        content, source_info = scraper.fetch_article(
+                            article.get("url"), 
+                            article.get("title")
+                        )
+                        show_article_detail(article, content, source_info, footer=BACK_PROMPT)
+                        wait_key()
+                else:
+                    wait_key()
+    finally:
+        # Drop queued prefetches (cancel_futures needs 3.9); running ones
+        # finish within PREFETCH_TIMEOUT
+        for _, future in prefetched.values():
+            future.cancel()
+        executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":
@@ -2,17 +2,21 @@
 Terminal UI for News Terminal - Simple Bloomberg-inspired design.
 """
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.layout import Layout
-from rich.live import Live
 from rich.align import Align
+from rich.style import Style
 from rich import box
 from datetime import datetime
-import sys
-import os
+from itertools import islice
+from typing import TYPE_CHECKING
+import time
+
+# Live and Layout are only needed once the UI goes full-screen
+if TYPE_CHECKING:
+    from rich.layout import Layout
 
 # Colors - Orange accent with dark theme, easy on eyes
 ORANGE = "#FF9500"
@@ -22,10 +26,42 @@ DARK_BG = "#1a1a1a"
 GRAY = "#888888"
 WHITE = "#FFFFFF"
 
+# Prebuilt styles, so renders neither rebuild nor re-parse style strings
+STYLE_BOLD_ORANGE = Style(color=ORANGE, bold=True)
+STYLE_BOLD_SOFT = Style(color=SOFT_ORANGE, bold=True)
+STYLE_ITALIC_SOFT = Style(color=SOFT_ORANGE, italic=True)
+STYLE_BOLD_GRAY = Style(color=GRAY, bold=True)
+STYLE_DIM_GRAY = Style(color=GRAY, dim=True)
+STYLE_BOLD_WHITE = Style(color=WHITE, bold=True)
+STYLE_URL = Style(color=SOFT_ORANGE, underline=True)
+STYLE_MENU_ACTIVE = Style(color=ORANGE, bgcolor="#333333", bold=True)
+STYLE_HEADER_BG = Style(bgcolor="#0d0d0d")
+
+
+def prepare_article(article: dict) -> dict:
+    """Precompute an article's list-row cells, cached on the dict itself."""
+    title = article.get("title") or "No title"
+    article["_display_title"] = (title[:80] + "...") if len(title) > 80 else title
+    article["_source_text"] = Text(article.get("source", ""), style=STYLE_ITALIC_SOFT)
+    article["_time_text"] = Text(article.get("published", ""), style=STYLE_DIM_GRAY)
+    return article
+
 
 class NewsTerminalUI:
     """Simple terminal UI for displaying news."""
     
+    # (key, label) pairs for the category menu bar
+    _MENU_ITEMS = (
+        ("1", "Headlines"),
+        ("2", "Business"),
+        ("3", "Tech"),
+        ("4", "Sports"),
+        ("5", "Health"),
+    )
+    
+    # Article rows shown at once; the window scrolls with the selection
+    VIEW_ROWS = 15
+    
     def __init__(self, console: Console = None):
         self.console = console or Console()
         self.current_category = "1"
@@ -38,59 +74,115 @@ class NewsTerminalUI:
             "4": "SPORTS",
             "5": "HEALTH"
         }
+        # Rebuilt only when the clock text / category changes
+        self._header_cache = (None, None)  # (epoch second, Panel)
+        self._menu_cache = (None, None)  # (category, Text)
+        # Articles panel, rebuilt only when the list, category or visible
+        # window changes; moving the selection only restyles affected cells
+        self._table_key = (None, None)  # (articles list, category)
+        self._table_panel = None
+        self._window_start = 0
+        self._table_selected = None
+        self._indicator_cells = []
+        self._title_cells = []
+        self._live = None
+    
+    def __enter__(self):
+        """Draw on the alternate screen, redrawing in place, until exit."""
+        from rich.live import Live
+        
+        self._live = Live(console=self.console, screen=True, auto_refresh=False)
+        self._live.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._live.stop()
+        self._live = None
     
     def clear(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.console.clear()
     
     def render_header(self) -> Panel:
         """Render the header with logo and time."""
-        now = datetime.now().strftime("%H:%M:%S • %d %b %Y")
+        sec = int(time.time())
+        if sec == self._header_cache[0]:
+            return self._header_cache[1]
+        now = datetime.fromtimestamp(sec).strftime("%H:%M:%S • %d %b %Y")
         
         header_text = Text()
-        header_text.append("██ ", style=f"bold {ORANGE}")
-        header_text.append("NEWS TERMINAL", style=f"bold {ORANGE}")
+        header_text.append("██ ", style=STYLE_BOLD_ORANGE)
+        header_text.append("NEWS TERMINAL", style=STYLE_BOLD_ORANGE)
         header_text.append("  │  ", style=GRAY)
-        header_text.append(now, style=f"{SOFT_ORANGE}")
+        header_text.append(now, style=SOFT_ORANGE)
         
-        return Panel(
+        header = Panel(
             Align.center(header_text),
-            style=f"on #0d0d0d",
+            style=STYLE_HEADER_BG,
             box=box.HEAVY,
             border_style=ORANGE
         )
+        self._header_cache = (sec, header)
+        return header
     
     def render_menu(self) -> Text:
         """Render category menu bar."""
-        menu = Text()
+        if self.current_category == self._menu_cache[0]:
+            return self._menu_cache[1]
         
-        categories = [
-            ("1", "Headlines"),
-            ("2", "Business"),
-            ("3", "Tech"),
-            ("4", "Sports"),
-            ("5", "Health"),
-        ]
+        menu = Text()
         
-        for key, name in categories:
+        for key, name in self._MENU_ITEMS:
             if key == self.current_category:
-                menu.append(f" [{key}] {name} ", style=f"bold {ORANGE} on #333333")
+                menu.append(f" [{key}] {name} ", style=STYLE_MENU_ACTIVE)
             else:
-                menu.append(f" [{key}] {name} ", style=f"{GRAY}")
+                menu.append(f" [{key}] {name} ", style=GRAY)
             menu.append(" ")
         
         menu.append("  │  ", style=GRAY)
-        menu.append("[R] ", style=f"bold {SOFT_ORANGE}")
+        menu.append("[R] ", style=STYLE_BOLD_SOFT)
         menu.append("Refresh  ", style=GRAY)
-        menu.append("[Q] ", style=f"bold {SOFT_ORANGE}")
+        menu.append("[Q] ", style=STYLE_BOLD_SOFT)
         menu.append("Quit", style=GRAY)
         
+        self._menu_cache = (self.current_category, menu)
         return menu
     
     def render_articles(self, articles: list) -> Panel:
         """Render the news articles list."""
         self.articles = articles
         
+        if not articles:
+            return Panel(
+                Align.center(Text("No articles available. Press [R] to refresh.", style=GRAY)),
+                title=Text(self.category_names.get(self.current_category, "NEWS"), style=STYLE_BOLD_ORANGE),
+                border_style=ORANGE,
+                box=box.ROUNDED
+            )
+        
+        # Scroll the visible window only when the selection leaves it
+        start = self._window_start
+        if self.selected_index < start:
+            start = self.selected_index
+        elif self.selected_index >= start + self.VIEW_ROWS:
+            start = self.selected_index - self.VIEW_ROWS + 1
+        start = max(0, min(start, len(articles) - self.VIEW_ROWS))
+        
+        key_articles, key_category = self._table_key
+        if (key_articles is not articles or key_category != self.current_category
+                or start != self._window_start):
+            self._window_start = start
+            self._table_panel = self._build_articles_panel(articles)
+            self._table_key = (articles, self.current_category)
+        elif self.selected_index != self._table_selected:
+            self._style_row(self._table_selected, False)
+            self._style_row(self.selected_index, True)
+            self._table_selected = self.selected_index
+        
+        return self._table_panel
+    
+    def _build_articles_panel(self, articles: list) -> Panel:
+        """Fill the table with the visible window and remember its row cells."""
         table = Table(
             show_header=False,
             box=None,
@@ -102,65 +194,65 @@ class NewsTerminalUI:
         table.add_column("source", ratio=1, justify="right")
         table.add_column("time", width=18, justify="right")
         
-        if not articles:
-            return Panel(
-                Align.center(Text("No articles available. Press [R] to refresh.", style=GRAY)),
-                title=f"[bold {ORANGE}]{self.category_names.get(self.current_category, 'NEWS')}[/]",
-                border_style=ORANGE,
-                box=box.ROUNDED
-            )
-        
-        for i, article in enumerate(articles[:15]):  # Show max 15 articles
-            # Indicator
-            if i == self.selected_index:
-                indicator = Text("►", style=f"bold {ORANGE}")
-            else:
-                indicator = Text(" ")
-            
-            # Title - truncate if too long
-            title_text = article.get("title", "No title")[:80]
-            if len(article.get("title", "")) > 80:
-                title_text += "..."
+        self._indicator_cells = []
+        self._title_cells = []
+        start = self._window_start
+        for article in islice(articles, start, start + self.VIEW_ROWS):
+            if "_display_title" not in article:
+                prepare_article(article)
             
-            if i == self.selected_index:
-                title = Text(title_text, style=f"bold {WHITE}")
-            else:
-                title = Text(title_text, style=f"{GRAY}")
-            
-            # Source
-            source = Text(article.get("source", ""), style=f"italic {SOFT_ORANGE}")
-            
-            # Time
-            time_text = Text(article.get("published", ""), style=f"dim {GRAY}")
+            indicator = Text(" ")
+            title = Text(article["_display_title"], style=GRAY)
+            self._indicator_cells.append(indicator)
+            self._title_cells.append(title)
             
-            table.add_row(indicator, title, source, time_text)
+            table.add_row(indicator, title, article["_source_text"], article["_time_text"])
+        
+        self._table_selected = self.selected_index
+        self._style_row(self.selected_index, True)
         
         return Panel(
             table,
-            title=f"[bold {ORANGE}]{self.category_names.get(self.current_category, 'NEWS')}[/]",
-            subtitle=f"[{GRAY}]↑↓ Navigate • Enter to read • {len(articles)} articles[/]",
+            title=Text(self.category_names.get(self.current_category, "NEWS"), style=STYLE_BOLD_ORANGE),
+            subtitle=Text(f"↑↓ Navigate • Enter to read • {len(articles)} articles", style=GRAY),
             border_style=ORANGE,
             box=box.ROUNDED,
             padding=(1, 2)
         )
     
+    def _style_row(self, index: int, selected: bool):
+        """Restyle one article's indicator and title cells in place."""
+        row = index - self._window_start
+        if not 0 <= row < len(self._indicator_cells):
+            return
+        indicator = self._indicator_cells[row]
+        title = self._title_cells[row]
+        if selected:
+            indicator.plain = "►"
+            indicator.style = STYLE_BOLD_ORANGE
+            title.style = STYLE_BOLD_WHITE
+        else:
+            indicator.plain = " "
+            indicator.style = ""
+            title.style = GRAY
+    
     def render_detail(self, article: dict) -> Panel:
         """Render article detail view."""
         content = Text()
         
         # Title
-        content.append(article.get("title", "No title"), style=f"bold {ORANGE}")
+        content.append(article.get("title", "No title"), style=STYLE_BOLD_ORANGE)
         content.append("\n\n")
         
         # Source and time
-        content.append("Source: ", style=f"bold {GRAY}")
+        content.append("Source: ", style=STYLE_BOLD_GRAY)
         content.append(article.get("source", "Unknown"), style=SOFT_ORANGE)
         content.append("  •  ", style=GRAY)
         content.append(article.get("published", ""), style=GRAY)
         content.append("\n")
         
         if article.get("author") and article["author"] != "Unknown":
-            content.append("Author: ", style=f"bold {GRAY}")
+            content.append("Author: ", style=STYLE_BOLD_GRAY)
             content.append(article["author"], style=WHITE)
             content.append("\n")
         
@@ -173,13 +265,13 @@ class NewsTerminalUI:
             content.append("\n\n")
         
         # URL
-        content.append("Read more: ", style=f"bold {GRAY}")
-        content.append(article.get("url", ""), style=f"underline {SOFT_ORANGE}")
+        content.append("Read more: ", style=STYLE_BOLD_GRAY)
+        content.append(article.get("url", ""), style=STYLE_URL)
         
         return Panel(
             content,
-            title=f"[bold {ORANGE}]ARTICLE DETAIL[/]",
-            subtitle=f"[{GRAY}]Press any key to go back[/]",
+            title=Text("ARTICLE DETAIL", style=STYLE_BOLD_ORANGE),
+            subtitle=Text("Press any key to go back", style=GRAY),
             border_style=ORANGE,
             box=box.ROUNDED,
             padding=(1, 2)
@@ -188,7 +280,7 @@ class NewsTerminalUI:
     def render_loading(self) -> Panel:
         """Render loading indicator."""
         return Panel(
-            Align.center(Text("Loading news...", style=f"bold {ORANGE}")),
+            Align.center(Text("Loading news...", style=STYLE_BOLD_ORANGE)),
             border_style=GRAY,
             box=box.ROUNDED
         )
@@ -203,32 +295,44 @@ class NewsTerminalUI:
     
     def display(self, articles: list):
         """Display the main news view."""
-        self.clear()
-        self.console.print(self.render_header())
-        self.console.print(Align.center(self.render_menu()))
-        self.console.print()
-        self.console.print(self.render_articles(articles))
+        self.show(
+            Align.center(self.render_menu()),
+            Text(),
+            self.render_articles(articles)
+        )
     
     def display_detail(self, article: dict):
         """Display article detail view."""
-        self.clear()
-        self.console.print(self.render_header())
-        self.console.print()
-        self.console.print(self.render_detail(article))
+        self.show(Text(), self.render_detail(article))
     
     def display_loading(self):
         """Display loading screen."""
-        self.clear()
-        self.console.print(self.render_header())
-        self.console.print()
-        self.console.print(self.render_loading())
+        self.show(Text(), self.render_loading())
     
     def display_error(self, message: str):
         """Display error screen."""
-        self.clear()
-        self.console.print(self.render_header())
-        self.console.print()
-        self.console.print(self.render_error(message))
+        self.show(Text(), self.render_error(message))
+    
+    def show(self, *renderables):
+        """Draw the header plus renderables as one frame."""
+        if self._live:
+            self._live.update(self.build_layout(*renderables), refresh=True)
+        else:
+            # Buffer the clear and the frame so they reach stdout in one write
+            with self.console:
+                self.clear()
+                self.console.print(Group(self.render_header(), *renderables))
+    
+    def build_layout(self, *renderables) -> "Layout":
+        """Full-screen layout with the header docked on top."""
+        from rich.layout import Layout
+        
+        layout = Layout()
+        layout.split_column(
+            Layout(self.render_header(), name="header", size=3),
+            Layout(Group(*renderables), name="body")
+        )
+        return layout
     
     def navigate_up(self):
         """Move selection up."""
@@ -251,3 +355,4 @@ class NewsTerminalUI:
         if category in self.category_names:
             self.current_category = category
             self.selected_index = 0
+            self._menu_cache = (None, None)